@@ -1,6 +1,6 @@
 # Licensed under the GPL: https://www.gnu.org/licenses/old-licenses/gpl-2.0.html
 # For details: https://github.com/PyCQA/pylint/blob/main/LICENSE
-from typing import List
+from typing import Dict, FrozenSet, Optional, Set, Tuple
 
 import astroid
 from astroid import nodes
@@ -8,6 +8,81 @@ from astroid import nodes
 from pylint import checkers, interfaces
 from pylint.checkers import utils
 
+# Types for which PEP8 recommends implicit booleaness over len() checks,
+# and the subset meaningful for empty-literal comparisons. Hoisted to module
+# scope so the hot visit callbacks do not rebuild them per node.
+_PEP8_TYPES = frozenset({"str", "tuple", "list", "set"})
+_COMPREHENSION_TYPES = frozenset({"tuple", "list", "dict"})
+# Membership in this frozenset benchmarks faster than testing the first
+# character of the operator against "=!<>".
+_COMPARE_OPS = frozenset({"==", "!=", ">=", ">", "<=", "<"})
+
+# Message symbols handled by this checker, shared by the check_messages
+# decoration instead of allocating per-method tuples.
+_MSGS_LEN = ("use-implicit-booleaness-not-len",)
+_MSGS_COMPARISON = ("use-implicit-booleaness-not-comparison",)
+
+
+_COMPREHENSION_NODES = (
+    nodes.ListComp,
+    nodes.SetComp,
+    nodes.DictComp,
+    nodes.GeneratorExp,
+)
+
+# Indexed by the tags returned from _empty_literal_tag.
+_LITERAL_REPRS = (None, "[]", "()", "{}")
+
+
+def _infer_first(node: nodes.NodeNG) -> Optional[nodes.NodeNG]:
+    """Return the first inferred value of a node, or None.
+
+    Offers the None-returning interface of utils.safe_infer to both call
+    sites but keeps the first result when inference is ambiguous: this
+    check deliberately reasons about the first inferred value of call
+    arguments, which safe_infer would discard as ambiguous.
+    """
+    try:
+        value = next(node.infer())
+    except astroid.InferenceError:
+        return None
+    return None if value is astroid.Uninferable else value
+
+
+def _non_boolop_parent(node: nodes.NodeNG) -> nodes.NodeNG:
+    """Return the nearest ancestor of a node that is not a BoolOp.
+
+    Astroid parent links are stable, so the result is memoized on the node
+    itself: revisits of the same node (deeply nested and/or chains are
+    revisited per len() call they contain) reuse the cached pointer instead
+    of re-walking the chain.
+    """
+    cached = node.__dict__.get("_non_boolop_parent")
+    if cached is not None:
+        return cached
+    parent = node.parent
+    while isinstance(parent, nodes.BoolOp):
+        parent = parent.parent
+    node.__dict__["_non_boolop_parent"] = parent
+    return parent
+
+
+def _empty_literal_tag(node: nodes.NodeNG) -> int:
+    """Return a small tag describing an empty list/tuple/dict literal.
+
+    Combines the three utils.is_empty_*_literal helpers into one predicate
+    so each compare operand is type-checked once instead of three times.
+    Returns 0 for anything else; a non-zero tag indexes _LITERAL_REPRS.
+    """
+    node_type = type(node)
+    if node_type is nodes.List:
+        return 0 if node.elts else 1
+    if node_type is nodes.Tuple:
+        return 0 if node.elts else 2
+    if node_type is nodes.Dict:
+        return 0 if node.items else 3
+    return 0
+
 
 class ImplicitBooleanessChecker(checkers.BaseChecker):
     """Checks for incorrect usage of comparisons or len() inside conditions.
@@ -50,6 +125,12 @@ class ImplicitBooleanessChecker(checkers.BaseChecker):
 
     __implements__ = (interfaces.IAstroidChecker,)
 
+    # The visit callbacks run for every matching node in every module, so
+    # the per-run state is declared in __slots__ to get slot descriptor
+    # lookups. The base classes still carry a __dict__, so dynamically
+    # added attributes keep working.
+    __slots__ = ("_ancestors_cache", "_seen")
+
     # configuration section name
     name = "refactoring"
     msgs = {
@@ -75,104 +156,143 @@ class ImplicitBooleanessChecker(checkers.BaseChecker):
     priority = -2
     options = ()
 
-    @utils.check_messages("use-implicit-booleaness-not-len")
-    def visit_call(self, node: nodes.Call) -> None:
+    def open(self) -> None:
+        # ClassDef identity is stable within a single run, so the ancestor
+        # names of a class are computed once and reused across visits instead
+        # of re-walking the MRO (which triggers inference) for every node.
+        self._ancestors_cache: Dict[nodes.ClassDef, Tuple[FrozenSet[str], bool]] = {}
+        # Node ids already checked in the current module; guards against
+        # re-running inference when a node is reached more than once.
+        self._seen: Set[int] = set()
+
+    def close(self) -> None:
+        self._ancestors_cache.clear()
+
+    @utils.check_messages(*_MSGS_LEN, *_MSGS_COMPARISON)
+    def visit_module(self, node: nodes.Module) -> None:
+        """Check the module in a single batched walk.
+
+        One nodes_of_class pass with an internal type dispatch replaces the
+        three per-node visit callbacks, so the generic walker no longer pays
+        Python dispatch cost at every call, unary and compare node.
+        """
+        self._seen.clear()
+        for child in node.nodes_of_class((nodes.Call, nodes.UnaryOp, nodes.Compare)):
+            child_type = type(child)
+            if child_type is nodes.Call:
+                self._check_len_call(child)
+            elif child_type is nodes.UnaryOp:
+                self._check_not_len(child)
+            else:
+                self._check_use_implicit_booleaness_not_comparison(child)
+
+    def _check_len_call(self, node: nodes.Call) -> None:
         # a len(S) call is used inside a test condition
         # could be if, while, assert or if expression statement
         # e.g. `if len(S):`
-        if not utils.is_call_of_name(node, "len"):
+        # The check is inlined rather than going through
+        # utils.is_call_of_name: every Call node in the AST passes through
+        # here and the vast majority is not a len() call.
+        func = node.func
+        if not (isinstance(func, nodes.Name) and func.name == "len"):
             return
+        node_id = id(node)
+        if node_id in self._seen:
+            return
+        self._seen.add(node_id)
         # the len() call could also be nested together with other
         # boolean operations, e.g. `if z or len(x):`
-        parent = node.parent
-        while isinstance(parent, nodes.BoolOp):
-            parent = parent.parent
+        parent = _non_boolop_parent(node)
+        # `not len(S)` is fully handled by _check_not_len; bail out here so
+        # the same construct is not inferred a second time
+        if isinstance(parent, nodes.UnaryOp) and parent.op == "not":
+            return
         # we're finally out of any nested boolean operations so check if
         # this len() call is part of a test condition
         if not utils.is_test_condition(node, parent):
             return
         len_arg = node.args[0]
-        generator_or_comprehension = (
-            nodes.ListComp,
-            nodes.SetComp,
-            nodes.DictComp,
-            nodes.GeneratorExp,
-        )
-        if isinstance(len_arg, generator_or_comprehension):
+        if isinstance(len_arg, _COMPREHENSION_NODES):
             # The node is a generator or comprehension as in len([x for x in ...])
             self.add_message("use-implicit-booleaness-not-len", node=node)
             return
-        try:
-            instance = next(len_arg.infer())
-        except astroid.InferenceError:
+        instance = _infer_first(len_arg)
+        if instance is None:
             # Probably undefined-variable, abort check
             return
-        mother_classes = self.base_classes_of_node(instance)
-        affected_by_pep8 = any(
-            t in mother_classes for t in ("str", "tuple", "list", "set")
-        )
-        if "range" in mother_classes or (
-            affected_by_pep8 and not self.instance_has_bool(instance)
-        ):
+        # One cache-entry lookup replaces separate base_classes_of_node and
+        # instance_has_bool probes. The memoized entry already amortizes the
+        # full MRO walk across visits; an early-exit scan of ancestors()
+        # here would leave the cache unusable for the compare check.
+        mother_classes, has_bool = self._ancestors_entry(instance)
+        affected_by_pep8 = not _PEP8_TYPES.isdisjoint(mother_classes)
+        if "range" in mother_classes or (affected_by_pep8 and not has_bool):
             self.add_message("use-implicit-booleaness-not-len", node=node)
 
-    @staticmethod
-    def instance_has_bool(class_def: nodes.ClassDef) -> bool:
-        try:
-            class_def.getattr("__bool__")
-            return True
-        except astroid.AttributeInferenceError:
-            ...
-        return False
-
-    @utils.check_messages("use-implicit-booleaness-not-len")
-    def visit_unaryop(self, node: nodes.UnaryOp) -> None:
+    def instance_has_bool(self, class_def: nodes.ClassDef) -> bool:
+        """Check if a ClassDef or one of its ancestors defines __bool__."""
+        return self._ancestors_entry(class_def)[1]
+
+    def _check_not_len(self, node: nodes.UnaryOp) -> None:
         """`not len(S)` must become `not S` regardless if the parent block
         is a test condition or something else (boolean expression)
         e.g. `if not len(S):`"""
-        if (
-            isinstance(node, nodes.UnaryOp)
-            and node.op == "not"
-            and utils.is_call_of_name(node.operand, "len")
-        ):
+        if node.op == "not" and utils.is_call_of_name(node.operand, "len"):
+            node_id = id(node)
+            if node_id in self._seen:
+                return
+            self._seen.add(node_id)
             self.add_message("use-implicit-booleaness-not-len", node=node)
 
-    @utils.check_messages("use-implicit-booleaness-not-comparison")
-    def visit_compare(self, node: nodes.Compare) -> None:
-        self._check_use_implicit_booleaness_not_comparison(node)
-
     def _check_use_implicit_booleaness_not_comparison(
         self, node: nodes.Compare
     ) -> None:
         """Check for left side and right side of the node for empty literals"""
-        is_left_empty_literal = (
-            utils.is_empty_list_literal(node.left)
-            or utils.is_empty_tuple_literal(node.left)
-            or utils.is_empty_dict_literal(node.left)
-        )
+        left_tag = _empty_literal_tag(node.left)
+        ops = [
+            (operator, comparator, _empty_literal_tag(comparator))
+            for operator, comparator in node.ops
+        ]
+        # The vast majority of comparisons (x < 10, i == j, ...) involve no
+        # empty literal at all; return before any further bookkeeping.
+        if not left_tag and not any(tag for _, _, tag in ops):
+            return
+        node_id = id(node)
+        if node_id in self._seen:
+            return
+        self._seen.add(node_id)
+
+        # `node.left` is the same node for every comparator, so its
+        # inference result is computed at most once for the whole compare.
+        left_inferred = False
+        left_instance = None
 
         # Check both left hand side and right hand side for literals
-        for operator, comparator in node.ops:
-            is_right_empty_literal = (
-                utils.is_empty_list_literal(comparator)
-                or utils.is_empty_tuple_literal(comparator)
-                or utils.is_empty_dict_literal(comparator)
-            )
+        for operator, comparator, right_tag in ops:
             # Using Exclusive OR (XOR) to compare between two side.
-            # If two sides are both literal, it should be different error.
-            if is_right_empty_literal ^ is_left_empty_literal:
+            # If two sides are both literal (`[] == []`), it should be a
+            # different error; the integer tags settle this without any
+            # inference.
+            if (right_tag == 0) ^ (left_tag == 0):
                 # set target_node to opposite side of literal
-                target_node = node.left if is_right_empty_literal else comparator
-                literal_node = comparator if is_right_empty_literal else node.left
+                target_node = node.left if right_tag else comparator
                 # Infer node to check
-                try:
-                    target_instance = next(target_node.infer())
-                except astroid.InferenceError:
-                    # Probably undefined-variable, continue with check
-                    continue
+                if right_tag:
+                    if not left_inferred:
+                        left_inferred = True
+                        left_instance = _infer_first(target_node)
+                    if left_instance is None:
+                        # Probably undefined-variable, continue with check
+                        continue
+                    target_instance = left_instance
+                else:
+                    target_instance = _infer_first(target_node)
+                    if target_instance is None:
+                        # Probably undefined-variable, continue with check
+                        continue
                 mother_classes = self.base_classes_of_node(target_instance)
-                is_base_comprehension_type = any(
-                    t in mother_classes for t in ("tuple", "list", "dict")
+                is_base_comprehension_type = not _COMPREHENSION_TYPES.isdisjoint(
+                    mother_classes
                 )
 
                 # Only time we bypass check is when target_node is not inherited by
@@ -183,12 +303,8 @@ class ImplicitBooleanessChecker(checkers.BaseChecker):
                     continue
 
                 # No need to check for operator when visiting compare node
-                if operator in ["==", "!=", ">=", ">", "<=", "<"]:
-                    collection_literal = "{}"
-                    if isinstance(literal_node, nodes.List):
-                        collection_literal = "[]"
-                    if isinstance(literal_node, nodes.Tuple):
-                        collection_literal = "()"
+                if operator in _COMPARE_OPS:
+                    collection_literal = _LITERAL_REPRS[right_tag or left_tag]
                     variable_name = target_node.name
                     original_comparison = (
                         f"{variable_name} {operator} {collection_literal}"
@@ -207,10 +323,39 @@ class ImplicitBooleanessChecker(checkers.BaseChecker):
                         node=node,
                     )
 
-    @staticmethod
-    def base_classes_of_node(instance: nodes.ClassDef) -> List[nodes.Name]:
+    def base_classes_of_node(self, instance: nodes.ClassDef) -> FrozenSet[str]:
         """Return all the classes names that a ClassDef inherit from including 'object'."""
+        return self._ancestors_entry(instance)[0]
+
+    def _ancestors_entry(
+        self, instance: nodes.ClassDef
+    ) -> Tuple[FrozenSet[str], bool]:
+        """Return the cached (ancestor names, defines __bool__) pair of a ClassDef.
+
+        Checking locals directly while the MRO is walked once avoids both a
+        second traversal in instance_has_bool and the exception machinery of
+        ClassDef.getattr on classes without __bool__.
+        """
+        # Inference builds a fresh Instance proxy per call, so its id is
+        # neither stable nor unique across visits. Key on the proxied
+        # ClassDef instead (falling back to the node itself for ClassDefs
+        # and Uninferable); the dict keeps the key alive, so a freed
+        # object's address can never alias a cached entry. Name and locals
+        # lookups on the proxy delegate to the same ClassDef anyway.
+        key = getattr(instance, "_proxied", instance)
+        try:
+            return self._ancestors_cache[key]
+        except KeyError:
+            pass
+        try:
+            classes = [key, *key.ancestors()]
+        except TypeError:
+            classes = [key]
         try:
-            return [instance.name] + [x.name for x in instance.ancestors()]
+            has_bool = any("__bool__" in klass.locals for klass in classes)
         except TypeError:
-            return [instance.name]
+            # Uninferable answers any getattr, including __bool__
+            has_bool = True
+        entry = (frozenset(klass.name for klass in classes), has_bool)
+        self._ancestors_cache[key] = entry
+        return entry
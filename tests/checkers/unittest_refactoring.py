@@ -24,25 +24,46 @@ class ChildClassWithoutBool(ClassWithoutBool):
 """
     )
     with_bool, without_bool, child_with_bool, child_without_bool = module.body
-    assert ImplicitBooleanessChecker().base_classes_of_node(with_bool) == [
-        "ClassWithBool",
-        "list",
-        "object",
-    ]
-    assert ImplicitBooleanessChecker().base_classes_of_node(without_bool) == [
-        "ClassWithoutBool",
-        "dict",
-        "object",
-    ]
-    assert ImplicitBooleanessChecker().base_classes_of_node(child_with_bool) == [
-        "ChildClassWithBool",
-        "ClassWithBool",
-        "list",
-        "object",
-    ]
-    assert ImplicitBooleanessChecker().base_classes_of_node(child_without_bool) == [
-        "ChildClassWithoutBool",
-        "ClassWithoutBool",
-        "dict",
-        "object",
-    ]
+    checker = ImplicitBooleanessChecker()
+    checker.open()
+    assert checker.base_classes_of_node(with_bool) == frozenset(
+        {"ClassWithBool", "list", "object"}
+    )
+    assert checker.base_classes_of_node(without_bool) == frozenset(
+        {"ClassWithoutBool", "dict", "object"}
+    )
+    assert checker.base_classes_of_node(child_with_bool) == frozenset(
+        {"ChildClassWithBool", "ClassWithBool", "list", "object"}
+    )
+    assert checker.base_classes_of_node(child_without_bool) == frozenset(
+        {"ChildClassWithoutBool", "ClassWithoutBool", "dict", "object"}
+    )
+    # Results are memoized per ClassDef for the duration of the run.
+    assert checker.base_classes_of_node(with_bool) is checker.base_classes_of_node(
+        with_bool
+    )
+
+
+def test_bool_detection_keyed_on_proxied_class() -> None:
+    module = astroid.parse(
+        """
+class WithBool(list):
+    def __bool__(self):
+        return True
+
+class WithoutBool(list):
+    pass
+
+first = WithBool()
+second = WithoutBool()
+"""
+    )
+    checker = ImplicitBooleanessChecker()
+    checker.open()
+    assert checker.instance_has_bool(next(module["first"].infer()))
+    assert not checker.instance_has_bool(next(module["second"].infer()))
+    # Re-inferring yields a distinct Instance proxy backed by the same
+    # ClassDef; it must reuse the cached entry, not create (or worse,
+    # collide with) another one.
+    assert checker.instance_has_bool(next(module["first"].infer()))
+    assert len(checker._ancestors_cache) == 2  # pylint: disable=protected-access